@@ -4,8 +4,6 @@
 #include "Protocol.hpp"
 
 #include <algorithm>
-#include <memory>
-#include <sstream>
 #include <cassert>
 
 #include "lz4.h"
@@ -16,14 +14,15 @@ namespace CANyonero {
 //MARK: - Info
 Info Info::from_vector(const Bytes& data) {
     Info info;
-    std::stringstream ss;
-    ss.str(std::string(data.begin(), data.end()));
-
-    std::getline(ss, info.vendor, '\n');
-    std::getline(ss, info.model, '\n');
-    std::getline(ss, info.hardware, '\n');
-    std::getline(ss, info.serial, '\n');
-    std::getline(ss, info.firmware, '\n');
+    std::string* fields[] = { &info.vendor, &info.model, &info.hardware, &info.serial, &info.firmware };
+
+    auto it = data.begin();
+    for (auto field : fields) {
+        if (it == data.end()) { break; }
+        auto end = std::find(it, data.end(), '\n');
+        field->assign(it, end);
+        it = end == data.end() ? end : end + 1;
+    }
 
     return info;
 }
@@ -72,6 +71,17 @@ ChannelHandle PDU::channel() const {
     return _payload[0];
 }
 
+uint32_t PDU::id() const {
+    assert(_type == PDUType::received || _type == PDUType::receivedCompressed);
+    auto it = _payload.begin() + 1; // skip channel
+    return vector_read_uint32(it);
+}
+
+uint8_t PDU::extension() const {
+    assert(_type == PDUType::received || _type == PDUType::receivedCompressed);
+    return _payload[5]; // skip channel (1), id (4)
+}
+
 PeriodicMessageHandle PDU::periodicMessage() const {
     assert(_type == PDUType::endPeriodicMessage);
 
@@ -104,6 +114,12 @@ uint16_t PDU::milliseconds() const {
     return interval * 500;
 }
 
+uint16_t PDU::millivolts() const {
+    assert(_type == PDUType::voltage);
+    auto it = _payload.begin();
+    return vector_read_uint16(it);
+}
+
 Bytes PDU::data() const {
     switch (_type) {
         case PDUType::received:
@@ -122,19 +138,17 @@ Bytes PDU::data() const {
 Bytes PDU::uncompressedData() const {
     switch (_type) {
         case PDUType::receivedCompressed: {
-            auto length = uncompressedLength();
-            auto uncompressedData = std::make_unique<char[]>(length);
+            auto uncompressedData = Bytes(uncompressedLength());
             // offset computes from channel (1), id (4), extension (1), uncompressed length (2) = 8
-            LZ4_decompress_safe(reinterpret_cast<const char*>(_payload.data() + 8), uncompressedData.get(), _length - 8, length);
-            return Bytes(uncompressedData.get(), uncompressedData.get() + length);
+            LZ4_decompress_safe(reinterpret_cast<const char*>(_payload.data() + 8), reinterpret_cast<char*>(uncompressedData.data()), int(_payload.size() - 8), int(uncompressedData.size()));
+            return uncompressedData;
         }
 
         case PDUType::sendCompressed: {
-            auto length = uncompressedLength();
-            auto uncompressedData = std::make_unique<char[]>(length);
+            auto uncompressedData = Bytes(uncompressedLength());
             // offset computes from channel (1), uncompressed length (2) = 3
-            LZ4_decompress_safe(reinterpret_cast<const char*>(_payload.data() + 3), uncompressedData.get(), _length - 3, length);
-            return Bytes(uncompressedData.get(), uncompressedData.get() + length);
+            LZ4_decompress_safe(reinterpret_cast<const char*>(_payload.data() + 3), reinterpret_cast<char*>(uncompressedData.data()), int(_payload.size() - 3), int(uncompressedData.size()));
+            return uncompressedData;
         }
         default:
             assert(false);
@@ -167,25 +181,34 @@ std::string PDU::filename() const {
     return std::string(reinterpret_cast<const char*>(_payload.data()), _payload.size());
 }
 
-PDU::PDU(const Bytes& frame) {
-    assert(frame.size() >= PDU::HEADER_SIZE);
+PDU::PDU(const Bytes& frame): PDU(frame.data(), frame.size()) {}
+
+PDU::PDU(const uint8_t* frame, const size_t length) {
+    assert(length >= PDU::HEADER_SIZE);
     _length = frame[2] << 8 | frame[3];
-    assert(frame.size() == PDU::HEADER_SIZE + _length);
+    assert(length == PDU::HEADER_SIZE + _length);
 
     _type = static_cast<PDUType>(frame[1]);
-    _payload = Bytes(frame.begin() + 4, frame.end());
+    _payload = Bytes(frame + PDU::HEADER_SIZE, frame + length);
 }
 
 const Bytes PDU::frame() const {
 
-    std::vector<uint8_t> frame = {
+    Bytes frame;
+    frame.reserve(PDU::HEADER_SIZE + _payload.size());
+    appendFrame(frame);
+    return frame;
+}
+
+void PDU::appendFrame(Bytes& buffer) const {
+
+    buffer.insert(buffer.end(), {
         PDU::ATT,
         static_cast<uint8_t>(_type),
         static_cast<uint8_t>(_payload.size() >> 8),
         static_cast<uint8_t>(_payload.size() & 0xff),
-    };
-    frame.insert(frame.end(), _payload.begin(), _payload.end());
-    return frame;
+    });
+    buffer.insert(buffer.end(), _payload.begin(), _payload.end());
 }
 
 // Check whether there is a PDU in the `Bytes`.
@@ -194,20 +217,41 @@ const Bytes PDU::frame() const {
 // Returns < 0, if there is garbage in the buffer.
 // If a negative value is returned, the caller SHOULD remove the offending bytes and immediately call this method again.
 int PDU::containsPDU(const Bytes& bytes) {
+    return containsPDU(bytes.data(), bytes.size());
+}
 
-    auto it = std::find(bytes.begin(), bytes.end(), 0x1F);
-    if (it == bytes.end()) { return (int)-bytes.size(); } // ATT not found, remove everything.
-    if (it != bytes.begin()) { return (int)std::distance(it, bytes.begin()); } // ATT found w/ leading garbage.
+int PDU::containsPDU(const uint8_t* bytes, const size_t length) {
 
-    if (bytes.size() < PDU::HEADER_SIZE) { return -0; }
-    uint16_t payloadLength = bytes[2] << 8 | bytes[3];
-    if (bytes.size() < PDU::HEADER_SIZE + payloadLength) { return -0; }
-    return PDU::HEADER_SIZE + payloadLength;
+    if (length == 0) { return -0; }
+    if (bytes[0] != PDU::ATT) {
+        // Leading garbage: skip up to the next ATT (or remove everything, if there is none).
+        auto it = std::find(bytes + 1, bytes + length, PDU::ATT);
+        return (int)std::distance(it, bytes);
+    }
+
+    // ATT at the front, go straight for the length prefix.
+    if (length < PDU::HEADER_SIZE) { return -0; }
+    const size_t pduLength = PDU::HEADER_SIZE + (bytes[2] << 8 | bytes[3]);
+    if (length < pduLength) { return -0; }
+    return (int)pduLength;
+}
+
+size_t PDU::extractPDUs(const uint8_t* bytes, const size_t length, std::vector<PDU>& pdus) {
+
+    size_t offset = 0;
+    while (offset < length) {
+        auto result = containsPDU(bytes + offset, length - offset);
+        if (result == 0) { break; } // need more data
+        if (result < 0) { offset += -result; continue; } // drop garbage
+        pdus.emplace_back(bytes + offset, result);
+        offset += result;
+    }
+    return offset;
 }
 
 //MARK: - Tester -> Adapter PDU Construction
-PDU PDU::ping(std::vector<uint8_t> payload) {
-    return PDU(PDUType::ping, payload);
+PDU PDU::ping(Bytes payload) {
+    return PDU(PDUType::ping, std::move(payload));
 }
 
 PDU PDU::requestInfo() {
@@ -227,18 +271,18 @@ PDU PDU::openChannel(const ChannelProtocol protocol, uint32_t bitrate, uint8_t r
     vector_append_uint32(payload, bitrate);
     uint8_t separationTime = rxSeparationTime << 4 | txSeparationTime;
     payload.push_back(separationTime);
-    return PDU(PDUType::openChannel, payload);
+    return PDU(PDUType::openChannel, std::move(payload));
 }
 
 PDU PDU::closeChannel(const ChannelHandle handle) {
     auto payload = Bytes(1, handle);
-    return PDU(PDUType::openChannel, payload);
+    return PDU(PDUType::openChannel, std::move(payload));
 }
 
 PDU PDU::send(const ChannelHandle handle, const Bytes& data) {
     auto payload = Bytes(1, handle);
     payload.insert(payload.end(), data.begin(), data.end());
-    return PDU(PDUType::send, payload);
+    return PDU(PDUType::send, std::move(payload));
 }
 
 PDU PDU::sendCompressed(const ChannelHandle handle, const Bytes& uncompressedData) {
@@ -251,30 +295,30 @@ PDU PDU::sendCompressed(const ChannelHandle handle, const Bytes& uncompressedDat
     vector_append_uint16(payload, uncompressedLength);
     payload.insert(payload.end(), buffer, buffer + compressedLength);
     delete[] buffer;
-    return PDU(PDUType::sendCompressed, payload);
+    return PDU(PDUType::sendCompressed, std::move(payload));
 }
 
 PDU PDU::setArbitration(const ChannelHandle handle, const Arbitration arbitration) {
     auto payload = Bytes(1, handle);
     arbitration.to_vector(payload);
-    return PDU(PDUType::setArbitration, payload);
+    return PDU(PDUType::setArbitration, std::move(payload));
 }
 
 PDU PDU::startPeriodicMessage(const uint8_t interval, const Arbitration arbitration, const Bytes& data) {
     auto payload = Bytes(1, interval);
     arbitration.to_vector(payload);
     payload.insert(payload.end(), data.begin(), data.end());
-    return PDU(PDUType::startPeriodicMessage, payload);
+    return PDU(PDUType::startPeriodicMessage, std::move(payload));
 }
 
 PDU PDU::endPeriodicMessage(const PeriodicMessageHandle handle) {
     auto payload = Bytes(1, handle);
-    return PDU(PDUType::endPeriodicMessage, payload);
+    return PDU(PDUType::endPeriodicMessage, std::move(payload));
 }
 
 PDU PDU::rpcCall(const std::string& string) {
     auto payload = Bytes(string.begin(), string.end());
-    return PDU(PDUType::rpcCall, payload);
+    return PDU(PDUType::rpcCall, std::move(payload));
 }
 
 PDU PDU::prepareForUpdate() {
@@ -294,8 +338,8 @@ PDU PDU::ok() {
     return PDU(PDUType::ok);
 }
 
-PDU PDU::pong(const Bytes payload) {
-    return PDU(PDUType::pong, payload);
+PDU PDU::pong(Bytes payload) {
+    return PDU(PDUType::pong, std::move(payload));
 }
 
 PDU PDU::info(const std::string vendor, const std::string model, const std::string hardware, const std::string serial, const std::string firmware) {
@@ -316,23 +360,23 @@ PDU PDU::info(const std::string vendor, const std::string model, const std::stri
     payload.push_back('\n');
     payload.insert(payload.end(), firmware_bytes.begin(), firmware_bytes.end());
 
-    return PDU(PDUType::info, payload);
+    return PDU(PDUType::info, std::move(payload));
 }
 
 PDU PDU::voltage(const uint16_t millivolts) {
     auto payload = Bytes();
     vector_append_uint16(payload, millivolts);
-    return PDU(PDUType::voltage, payload);
+    return PDU(PDUType::voltage, std::move(payload));
 }
 
 PDU PDU::channelOpened(const ChannelHandle handle) {
     auto payload = Bytes(1, handle);
-    return PDU(PDUType::channelOpened, payload);
+    return PDU(PDUType::channelOpened, std::move(payload));
 }
 
 PDU PDU::channelClosed(const ChannelHandle handle) {
     auto payload = Bytes(1, handle);
-    return PDU(PDUType::channelClosed, payload);
+    return PDU(PDUType::channelClosed, std::move(payload));
 }
 
 PDU PDU::received(const ChannelHandle handle, const uint32_t id, const uint8_t extension, const Bytes& data) {
@@ -340,7 +384,7 @@ PDU PDU::received(const ChannelHandle handle, const uint32_t id, const uint8_t e
     vector_append_uint32(payload, id);
     payload.push_back(extension);
     payload.insert(payload.end(), data.begin(), data.end());
-    return PDU(PDUType::received, payload);
+    return PDU(PDUType::received, std::move(payload));
 }
 
 PDU PDU::receivedCompressed(const ChannelHandle handle, const uint32_t id, const uint8_t extension, const Bytes& uncompressedData) {
@@ -355,17 +399,17 @@ PDU PDU::receivedCompressed(const ChannelHandle handle, const uint32_t id, const
     vector_append_uint16(payload, uncompressedLength);
     payload.insert(payload.end(), buffer, buffer + compressedLength);
     delete[] buffer;
-    return PDU(PDUType::receivedCompressed, payload);
+    return PDU(PDUType::receivedCompressed, std::move(payload));
 }
 
 PDU PDU::periodicMessageStarted(const PeriodicMessageHandle handle) {
     auto payload = Bytes(1, handle);
-    return PDU(PDUType::periodicMessageStarted, payload);
+    return PDU(PDUType::periodicMessageStarted, std::move(payload));
 }
 
 PDU PDU::periodicMessageEnded(const PeriodicMessageHandle handle) {
     auto payload = Bytes(1, handle);
-    return PDU(PDUType::periodicMessageEnded, payload);
+    return PDU(PDUType::periodicMessageEnded, std::move(payload));
 }
 
 PDU PDU::updateStartedSendData() {
@@ -382,7 +426,7 @@ PDU PDU::updateCompleted() {
 
 PDU PDU::rpcResponse(const std::string& string) {
     auto payload = Bytes(string.begin(), string.end());
-    return PDU(PDUType::rpcResponse, payload);
+    return PDU(PDUType::rpcResponse, std::move(payload));
 }
 
 PDU PDU::rpcBinaryResponse(const Bytes& data) {
@@ -46,47 +46,80 @@ struct Frame {
     {
     }
 
+    /// Creates a frame from its on-the-wire structure (exactly 7 or 8 bytes), taking ownership.
+    Frame(Bytes&& bytes)
+    :bytes(std::move(bytes))
+    {
+    }
+
+    // The builders below start out with a fully padded frame of the requested width
+    // and stamp PCI and data into it, i.e. every frame costs exactly one allocation.
+
     /// Returns an FC.
     static Frame flowControl(FlowStatus status, uint8_t blockSize, uint8_t separationTime, uint8_t width) {
-        uint8_t pci = uint8_t(Type::flowControl) | uint8_t(status);
-        std::vector<uint8_t> vector { pci, blockSize, separationTime };
-        vector.resize(width, ISOTP::padding);
-        return Frame(vector);
+        auto vector = Bytes(width, ISOTP::padding);
+        vector[0] = uint8_t(Type::flowControl) | uint8_t(status);
+        vector[1] = blockSize;
+        vector[2] = separationTime;
+        return Frame(std::move(vector));
     }
 
     /// Returns an SF.
     static Frame single(const Bytes& bytes, uint8_t width) {
-        assert(bytes.size() <= 7);
-        uint8_t pci = uint8_t(Type::single) | uint8_t(bytes.size());
-        auto vector = std::vector<uint8_t> { pci };
-        vector.insert(vector.end(), bytes.begin(), bytes.end());
-        vector.resize(width, ISOTP::padding);
-        return Frame(vector);
+        assert(bytes.size() < width);
+        // Never write past the frame, even with asserts disabled.
+        const auto length = std::min<size_t>(bytes.size(), width - 1);
+        auto vector = Bytes(width, ISOTP::padding);
+        vector[0] = uint8_t(Type::single) | uint8_t(length);
+        std::copy(bytes.begin(), bytes.begin() + length, vector.begin() + 1);
+        return Frame(std::move(vector));
     }
 
     /// Returns a FF.
     static Frame first(uint16_t pduLength, const Bytes& bytes, uint8_t width) {
-        uint8_t pciHi = uint8_t(Type::first) | uint8_t(pduLength >> 8);
-        uint8_t pciLo = uint8_t(pduLength & 0xFF);
-        auto vector = std::vector<uint8_t> { pciHi, pciLo };
-        vector.insert(vector.end(), bytes.begin(), bytes.begin() + width - 2);
-        return Frame(vector);
+        auto vector = Bytes(width);
+        vector[0] = uint8_t(Type::first) | uint8_t(pduLength >> 8);
+        vector[1] = uint8_t(pduLength & 0xFF);
+        std::copy(bytes.begin(), bytes.begin() + width - 2, vector.begin() + 2);
+        return Frame(std::move(vector));
     }
 
     /// Returns a CF.
     static Frame consecutive(uint8_t sequenceNumber, const Bytes& bytes, uint8_t count, uint8_t width) {
+        return consecutive(sequenceNumber, bytes.begin(), count, width);
+    }
+
+    /// Returns a CF with `count` bytes starting at `begin`.
+    static Frame consecutive(uint8_t sequenceNumber, Bytes::const_iterator begin, uint8_t count, uint8_t width) {
         assert(sequenceNumber <= 0x0F);
         assert(count);
-        assert(count <= width);
-        uint8_t pci = uint8_t(Type::consecutive) | uint8_t(sequenceNumber);
-        auto vector = std::vector<uint8_t> { pci };
-        vector.insert(vector.end(), bytes.begin(), bytes.begin() + count);
-        vector.resize(width, ISOTP::padding);
-        return Frame(vector);
+        assert(count < width);
+        auto vector = Bytes(width, ISOTP::padding);
+        vector[0] = uint8_t(Type::consecutive) | uint8_t(sequenceNumber);
+        std::copy(begin, begin + count, vector.begin() + 1);
+        return Frame(std::move(vector));
     }
 
     /// Returns the frame type.
-    Type type() {
+    Type type() const { return type(bytes); }
+    /// Returns the FC status.
+    FlowStatus flowStatus() const { return flowStatus(bytes); }
+    /// Returns the PDU length for an SF.
+    uint8_t singleLength() const { return singleLength(bytes); }
+    /// Returns the PDU length for an FF.
+    uint16_t firstLength() const { return firstLength(bytes); }
+    /// Returns SN.
+    uint8_t consecutiveSequenceNumber() const { return consecutiveSequenceNumber(bytes); }
+    /// Returns BS.
+    uint8_t blockSize() const { return blockSize(bytes); }
+    /// Returns ST in microseconds.
+    uint16_t separationTime() const { return separationTime(bytes); }
+
+    // The following accessors work on an on-the-wire structure, so that incoming
+    // frames can be inspected without copying them into a ``Frame`` first.
+
+    /// Returns the frame type.
+    static Type type(const Bytes& bytes) {
         switch (bytes[0] & 0xF0) {
             case 0x00: return Type::single;
             case 0x10: return Type::first;
@@ -97,7 +130,7 @@ struct Frame {
     }
 
     /// Returns the FC status.
-    FlowStatus flowStatus() {
+    static FlowStatus flowStatus(const Bytes& bytes) {
         assert((bytes[0] & 0xF0) == 0x30); // ensure this is a flow control frame
         switch(bytes[0] & 0x0F) {
             case 0x00: return FlowStatus::clearToSend;
@@ -108,35 +141,35 @@ struct Frame {
     }
 
     /// Returns the PDU length for an SF.
-    uint8_t singleLength() {
+    static uint8_t singleLength(const Bytes& bytes) {
         assert((bytes[0] & 0xF0) == 0x00); // ensure this is a single frame
         return bytes[0] & 0x0F;
     }
 
     /// Returns the PDU length for an FF.
-    uint16_t firstLength() {
+    static uint16_t firstLength(const Bytes& bytes) {
         assert((bytes[0] & 0xF0) == 0x10); // ensure this is a first frame
         return uint16_t((bytes[0] & 0x0F)) << 8 | bytes[1];
     }
 
     /// Returns SN.
-    uint8_t consecutiveSequenceNumber() {
+    static uint8_t consecutiveSequenceNumber(const Bytes& bytes) {
         assert((bytes[0] & 0xF0) == 0x20); // ensure this is a consecutive frame
         return bytes[0] & 0x0F;
     }
 
     /// Returns BS.
-    uint8_t blockSize() {
+    static uint8_t blockSize(const Bytes& bytes) {
         assert((bytes[0] & 0xF0) == 0x30); // ensure this is a flow control frame
         return bytes[1];
     }
 
     /// Returns ST in microseconds.
-    uint16_t separationTime() {
+    static uint16_t separationTime(const Bytes& bytes) {
         assert((bytes[0] & 0xF0) == 0x30); // ensure this is a flow control frame
         return separationTimeToMicroseconds(bytes[2]);
     }
-    
+
     static uint16_t separationTimeToMicroseconds(SeparationTime stMin) {
         // Conversion as defined by ISO-15765-2:2016:
         // 1. Up to (and including) 0x7F, it's milliseconds.
@@ -228,6 +261,7 @@ public:
     // State
     State state = State::idle;
     Bytes sendingPayload;
+    size_t sendingOffset = 0;
     uint8_t sendingSequenceNumber = 0;
 
     Bytes receivingPayload;
@@ -265,6 +299,7 @@ public:
         auto frame = Frame::first(bytes.size(), bytes, width);
         state = State::sending;
         sendingPayload = Bytes(bytes.begin() + width - 2, bytes.end());
+        sendingOffset = 0;
         sendingSequenceNumber = 0x01;
         return { .type = Action::Type::writeFrames, .frames = { 1, frame } };
     }
@@ -318,24 +353,26 @@ public:
 
 private:
     Action parseFlowControlFrame(const Bytes& bytes) {
-        auto frame = Frame(bytes);
-        if (frame.type() != Frame::Type::flowControl) { return { Action::Type::protocolViolation, "Unexpected frame type received while sending. Did expect FLOW CONTROL." }; }
+        if (Frame::type(bytes) != Frame::Type::flowControl) { return { Action::Type::protocolViolation, "Unexpected frame type received while sending. Did expect FLOW CONTROL." }; }
         
-        switch (frame.flowStatus()) {
+        switch (Frame::flowStatus(bytes)) {
 
             case Frame::FlowStatus::clearToSend: {
-                uint16_t numberOfUnconfirmedFrames = frame.blockSize();
+                uint16_t numberOfUnconfirmedFrames = Frame::blockSize(bytes);
                 if (numberOfUnconfirmedFrames == 0) {
                     numberOfUnconfirmedFrames = ISOTP::maximumUnconfirmedBlocks;
                 }
+                // Size the batch once: either the whole block or whatever is left of the payload.
+                const size_t pendingFrames = (sendingPayload.size() - sendingOffset + width - 2) / (width - 1);
                 auto nextFrames = std::vector<Frame> {};
+                nextFrames.reserve(std::min<size_t>(numberOfUnconfirmedFrames, pendingFrames));
                 for (uint16_t i = 0; i < numberOfUnconfirmedFrames; ++i) {
-                    auto nextChunkSize = std::min(width - 1, static_cast<int>(sendingPayload.size()));
-                    auto nextFrame = Frame::consecutive(sendingSequenceNumber, sendingPayload, nextChunkSize, width);
-                    sendingPayload.erase(sendingPayload.begin(), sendingPayload.begin() + nextChunkSize);
-                    nextFrames.insert(nextFrames.end(), nextFrame);
-                    
-                    if (sendingPayload.empty()) {
+                    // Advance an offset rather than erasing the sent chunk, which would move the whole remaining payload every time.
+                    auto nextChunkSize = std::min(width - 1, static_cast<int>(sendingPayload.size() - sendingOffset));
+                    nextFrames.push_back(Frame::consecutive(sendingSequenceNumber, sendingPayload.begin() + sendingOffset, nextChunkSize, width));
+                    sendingOffset += nextChunkSize;
+
+                    if (sendingOffset == sendingPayload.size()) {
                         reset();
                         break;
                     }
@@ -343,10 +380,10 @@ private:
                 }
                 return {
                     .type = Action::Type::writeFrames,
-                    .frames = nextFrames,
+                    .frames = std::move(nextFrames),
                     // NOTE: We are taking the maximum separation time from the received flow control frame
                     // and the separation time configured for this transceiver.
-                    .separationTime = std::max(frame.separationTime(), txSeparationTime),
+                    .separationTime = std::max(Frame::separationTime(bytes), txSeparationTime),
                 };
             }
                 
@@ -362,12 +399,11 @@ private:
     }
 
     Action parseDataFrame(const Bytes& bytes) {
-        auto frame = Frame(bytes);
-        switch (frame.type()) {
+        switch (Frame::type(bytes)) {
             case Frame::Type::single: {
                 if (state != State::idle) { return { Action::Type::protocolViolation, "Did receive SINGLE while we're not idle." }; }
 
-                auto pduLength = frame.singleLength();
+                auto pduLength = Frame::singleLength(bytes);
                 if (pduLength == 0)  { return { Action::Type::protocolViolation, "Did receive SINGLE with zero length in PCI." }; }
                 if (pduLength > bytes.size() - 1) { return { Action::Type::protocolViolation, "Did receive SINGLE with length exceeding payload." }; }
                 if (pduLength > 7) { return { Action::Type::protocolViolation, "Did receive SINGLE with invalid length > 7." }; }
@@ -382,9 +418,12 @@ private:
             case Frame::Type::first: {
                 if (state != State::idle) { return { Action::Type::protocolViolation, "Did receive FIRST while we're not idle." }; }
 
-                auto pduLength = frame.firstLength();
+                auto pduLength = Frame::firstLength(bytes);
                 if (pduLength < 8) { return { Action::Type::protocolViolation, "Did receive FIRST with invalid length < 8." }; }
-                receivingPayload = std::vector<uint8_t>(bytes.begin() + 2, bytes.end());
+                // The FF announces the total length, so allocate once instead of growing with every CF.
+                receivingPayload.clear();
+                receivingPayload.reserve(pduLength);
+                receivingPayload.insert(receivingPayload.end(), bytes.begin() + 2, bytes.end());
                 receivingPendingCounter = pduLength - (width - 2);
                 receivingUnconfirmedFramesCounter = blockSize;
                 if (receivingUnconfirmedFramesCounter == 0) {
@@ -402,7 +441,7 @@ private:
             case Frame::Type::consecutive: {
                 if (state != State::receiving) { return { Action::Type::protocolViolation, "Did receive CONSECUTIVE while we're not receiving." }; }
 
-                if (frame.consecutiveSequenceNumber() != receivingSequenceNumber) { return { Action::Type::protocolViolation, "Did receive CONSECUTIVE with unexpected sequence number." }; }
+                if (Frame::consecutiveSequenceNumber(bytes) != receivingSequenceNumber) { return { Action::Type::protocolViolation, "Did receive CONSECUTIVE with unexpected sequence number." }; }
                 receivingSequenceNumber = (receivingSequenceNumber + 1) & 0x0F;
 
                 auto length = std::min<uint16_t>(width - 1, receivingPendingCounter);
@@ -437,6 +476,7 @@ private:
     void reset() {
         state = State::idle;
         sendingPayload.clear();
+        sendingOffset = 0;
         sendingSequenceNumber = 0;
         receivingPayload.clear();
         receivingSequenceNumber = 0;
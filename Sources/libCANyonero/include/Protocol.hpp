@@ -238,7 +238,7 @@ class PDU {
     PDUType _type;
     uint16_t _length;
     std::vector<uint8_t> _payload;
-    static const uint8_t ATT = 0x1F;
+    static constexpr const uint8_t ATT = 0x1F;
 
 public:
 
@@ -246,8 +246,13 @@ public:
     PDU(const PDUType type, const std::vector<uint8_t>& payload): _type(type), _payload(payload) {
         //printf("Creating packet with type %02X and payload length %d\n", uint8_t(_type), _payload.size());
     };
+    PDU(const PDUType type, std::vector<uint8_t>&& payload): _type(type), _payload(std::move(payload)) {};
     PDU(const Bytes& frame);
+    /// Creates a PDU from its on-the-wire structure (exactly `length` bytes starting at `frame`).
+    PDU(const uint8_t* frame, const size_t length);
     const Bytes frame() const;
+    /// Appends the on-the-wire structure of this PDU to `buffer`, e.g. to send multiple PDUs with a single write.
+    void appendFrame(Bytes& buffer) const;
 
     /// Returns the PDU type.
     PDUType type() const { return _type; }
@@ -257,6 +262,10 @@ public:
     const Arbitration arbitration() const;
     /// Returns the channel handle value of this PDU, iff the PDU contains one.
     ChannelHandle channel() const;
+    /// Returns the id value of this PDU, iff the PDU is `received` or `receivedCompressed`.
+    uint32_t id() const;
+    /// Returns the id extension value of this PDU, iff the PDU is `received` or `receivedCompressed`.
+    uint8_t extension() const;
     /// Returns the periodic message value of this PDU, iff the PDU contains one.
     PeriodicMessageHandle periodicMessage() const;
     /// Returns the channel protocol value of this PDU, iff the PDU is `openChannel`.
@@ -267,6 +276,8 @@ public:
     std::pair<Microseconds, Microseconds> separationTimes() const;
     /// Returns the interval value of this PDU, iff the PDU is `startPeriodicMessage`.
     uint16_t milliseconds() const;
+    /// Returns the battery voltage (in millivolts) of this PDU, iff the PDU is `voltage`.
+    uint16_t millivolts() const;
     /// Returns the hardware data value of this PDU, iff the PDU is `send` or `received`.
     Bytes data() const;
     /// Returns the hardware data value of this PDU, iff the PDU is `sendCompressed` or `receivedCompressed`.
@@ -278,16 +289,23 @@ public:
     /// Returns the filename of the PDU, iff the PDU is `rpcSendBinary`.
     std::string filename() const;
 
-    /// Returns a negative value, if we need to more data to form a valid PDU.
-    /// Returns the number of consumed data, if there is enough data to create the PDU.
+    /// Returns the number of bytes forming the PDU, if there is enough data to create the PDU.
+    /// Returns 0, if the data looks like a PDU, but more data is needed.
+    /// Returns the negated number of leading garbage bytes, which the caller SHOULD drop before trying again.
     static int containsPDU(const Bytes& bytes);
+    /// Same as above, but works on a raw buffer. This allows scanning a receive buffer from an arbitrary offset,
+    /// i.e. without having to remove the already consumed bytes first.
+    static int containsPDU(const uint8_t* bytes, const size_t length);
+    /// Appends all complete PDUs found in the buffer to `pdus`, skipping garbage on the way.
+    /// Returns the number of consumed bytes. Trailing bytes of an incomplete PDU are not consumed.
+    static size_t extractPDUs(const uint8_t* bytes, const size_t length, std::vector<PDU>& pdus);
 
     //
     // Tester -> Adapter
     //
 
     /// Creates a `ping` PDU.
-    static PDU ping(const Bytes payload = {});
+    static PDU ping(Bytes payload = {});
     /// Creates a `requestInfo` PDU.
     static PDU requestInfo();
     /// Creates a `readVoltage` PDU.
@@ -326,7 +344,7 @@ public:
     /// Creates an `OK` PDU.
     static PDU ok();
     /// Creates a `pong` PDU.
-    static PDU pong(const Bytes payload = {});
+    static PDU pong(Bytes payload = {});
     /// Creates an `info` PDU.
     static PDU info(const std::string vendor, const std::string model, const std::string hardware, const std::string serial, const std::string firmware);
     /// Creates a `voltage` PDU.
@@ -53,6 +53,37 @@ using namespace CANyonero::ISOTP;
     XCTAssertEqual(frame.bytes, expected);
 }
 
+-(void)testSingleFrameBuilderMax {
+    auto frame = Frame::single({ 0x31, 0x32, 0x33, 0x34, 0x35, 0x36, 0x37 }, 8);
+    auto expected = std::vector<uint8_t>{ 0x07, 0x31, 0x32, 0x33, 0x34, 0x35, 0x36, 0x37 };
+    XCTAssertEqual(frame.bytes, expected);
+
+    frame = Frame::single({ 0x31, 0x32, 0x33, 0x34, 0x35, 0x36 }, 7);
+    expected = std::vector<uint8_t>{ 0x06, 0x31, 0x32, 0x33, 0x34, 0x35, 0x36 };
+    XCTAssertEqual(frame.bytes, expected);
+}
+
+-(void)testSingleOrFirstExtendedAddressing {
+    auto isotp = Transceiver(Transceiver::Behavior::strict, Transceiver::Mode::extended, 0, 0, 0);
+    auto message = std::vector<uint8_t> { 0x31, 0x32, 0x33, 0x34, 0x35, 0x36 };
+    auto action = isotp.writePDU(message);
+    XCTAssertEqual(action.type, Transceiver::Action::Type::writeFrames);
+    XCTAssertEqual(action.frames.size(), 1);
+    auto frame = action.frames[0];
+    XCTAssertEqual(frame.bytes.size(), 7);
+    XCTAssertEqual(frame.type(), Frame::Type::single);
+    auto expected = std::vector<uint8_t>{ 0x06, 0x31, 0x32, 0x33, 0x34, 0x35, 0x36 };
+    XCTAssertEqual(frame.bytes, expected);
+
+    // Seven bytes no longer fit into a single frame with extended addressing.
+    message.push_back(0x37);
+    action = isotp.writePDU(message);
+    XCTAssertEqual(action.type, Transceiver::Action::Type::writeFrames);
+    XCTAssertEqual(action.frames.size(), 1);
+    XCTAssertEqual(action.frames[0].bytes.size(), 7);
+    XCTAssertEqual(action.frames[0].type(), Frame::Type::first);
+}
+
 -(void)testFirstConsecutive {
     auto message = std::vector<uint8_t> { 0x31, 0x32, 0x33, 0x34, 0x35, 0x36, 0x37, 0x38 };
     auto firstAction = _isotp->writePDU(message);
@@ -0,0 +1,133 @@
+///
+/// CANyonero. (C) 2022 - 2023 Dr. Michael 'Mickey' Lauer <mickey@vanille-media.de>
+///
+#import <XCTest/XCTest.h>
+#import <Foundation/Foundation.h>
+
+#import <string>
+#import <vector>
+#import <iostream>
+
+#import "Protocol.hpp"
+
+using namespace CANyonero;
+
+@interface PDU_Protocol : XCTestCase
+
+@end
+
+@implementation PDU_Protocol
+
+-(void)testContainsPDU {
+    XCTAssertEqual(PDU::containsPDU(Bytes {}), 0);
+    XCTAssertEqual(PDU::containsPDU(Bytes { 0x1F, 0x10 }), 0);
+    XCTAssertEqual(PDU::containsPDU(Bytes { 0x1F, 0x10, 0x00, 0x02, 0x01 }), 0);
+    XCTAssertEqual(PDU::containsPDU(Bytes { 0x1F, 0x10, 0x00, 0x02, 0x01, 0x02 }), 6);
+    XCTAssertEqual(PDU::containsPDU(Bytes { 0x1F, 0x10, 0x00, 0x02, 0x01, 0x02, 0x1F }), 6);
+    XCTAssertEqual(PDU::containsPDU(Bytes { 0x00, 0x00, 0x1F, 0x10 }), -2);
+    XCTAssertEqual(PDU::containsPDU(Bytes { 0x00, 0x00, 0x00 }), -3);
+}
+
+-(void)testContainsPDUAtOffset {
+    auto first = PDU::ping({ 0x01, 0x02, 0x03 }).frame();
+    auto second = PDU::readVoltage().frame();
+    auto buffer = first + second;
+    buffer.push_back(0x1F);
+
+    size_t offset = 0;
+    auto consumed = PDU::containsPDU(buffer.data() + offset, buffer.size() - offset);
+    XCTAssertEqual(consumed, first.size());
+    auto pdu = PDU(buffer.data() + offset, consumed);
+    XCTAssertEqual(pdu.type(), PDUType::ping);
+    XCTAssertEqual(pdu.payload(), Bytes({ 0x01, 0x02, 0x03 }));
+    offset += consumed;
+
+    consumed = PDU::containsPDU(buffer.data() + offset, buffer.size() - offset);
+    XCTAssertEqual(consumed, second.size());
+    pdu = PDU(buffer.data() + offset, consumed);
+    XCTAssertEqual(pdu.type(), PDUType::readVoltage);
+    XCTAssertTrue(pdu.payload().empty());
+    offset += consumed;
+
+    XCTAssertEqual(PDU::containsPDU(buffer.data() + offset, buffer.size() - offset), 0);
+}
+
+-(void)testExtractPDUs {
+    auto buffer = Bytes { 0x00, 0x01 };
+    PDU::ping({ 0x01, 0x02, 0x03 }).appendFrame(buffer);
+    buffer.push_back(0x02);
+    PDU::readVoltage().appendFrame(buffer);
+    auto incomplete = Bytes { 0x1F, 0x90, 0x00, 0x04, 0x01 };
+    buffer.insert(buffer.end(), incomplete.begin(), incomplete.end());
+
+    std::vector<PDU> pdus;
+    auto consumed = PDU::extractPDUs(buffer.data(), buffer.size(), pdus);
+    XCTAssertEqual(consumed, buffer.size() - incomplete.size());
+    XCTAssertEqual(pdus.size(), 2);
+    XCTAssertEqual(pdus[0].type(), PDUType::ping);
+    XCTAssertEqual(pdus[0].payload(), Bytes({ 0x01, 0x02, 0x03 }));
+    XCTAssertEqual(pdus[1].type(), PDUType::readVoltage);
+}
+
+-(void)testParseInfo {
+    auto pdu = PDU(PDU::info("Vanille-Media", "CANyonero Basic", "ESP32/A0", "1234567890", "0.0.1").frame());
+    XCTAssertEqual(pdu.type(), PDUType::info);
+    auto info = pdu.information();
+    XCTAssertEqual(info.vendor, std::string("Vanille-Media"));
+    XCTAssertEqual(info.model, std::string("CANyonero Basic"));
+    XCTAssertEqual(info.hardware, std::string("ESP32/A0"));
+    XCTAssertEqual(info.serial, std::string("1234567890"));
+    XCTAssertEqual(info.firmware, std::string("0.0.1"));
+
+    auto partial = Info::from_vector(Bytes { 'V', '\n', '\n', 'H' });
+    XCTAssertEqual(partial.vendor, std::string("V"));
+    XCTAssertEqual(partial.model, std::string(""));
+    XCTAssertEqual(partial.hardware, std::string("H"));
+    XCTAssertEqual(partial.serial, std::string(""));
+    XCTAssertEqual(partial.firmware, std::string(""));
+}
+
+-(void)testParseVoltage {
+    auto pdu = PDU(PDU::voltage(12345).frame());
+    XCTAssertEqual(pdu.type(), PDUType::voltage);
+    XCTAssertEqual(pdu.millivolts(), 12345);
+}
+
+-(void)testUncompressedData {
+    Bytes data;
+    for (int i = 0; i < 1000; ++i) { data.push_back(i % 7); }
+
+    auto received = PDU::receivedCompressed(0x01, 0x7E8, 0x00, data);
+    XCTAssertEqual(received.uncompressedLength(), data.size());
+    XCTAssertEqual(received.uncompressedData(), data);
+    XCTAssertEqual(PDU(received.frame()).uncompressedData(), data);
+
+    auto send = PDU::sendCompressed(0x01, data);
+    XCTAssertEqual(send.uncompressedLength(), data.size());
+    XCTAssertEqual(send.uncompressedData(), data);
+    XCTAssertEqual(PDU(send.frame()).uncompressedData(), data);
+}
+
+-(void)testParseReceived {
+    auto data = Bytes { 0x02, 0x10, 0x03 };
+    auto pdu = PDU(PDU::received(0x01, 0x18DAF110, 0xF1, data).frame());
+    XCTAssertEqual(pdu.type(), PDUType::received);
+    XCTAssertEqual(pdu.channel(), 0x01);
+    XCTAssertEqual(pdu.id(), 0x18DAF110);
+    XCTAssertEqual(pdu.extension(), 0xF1);
+    XCTAssertEqual(pdu.data(), data);
+}
+
+-(void)testAppendFrame {
+    auto ping = PDU::ping({ 0x01, 0x02 });
+    auto voltage = PDU::readVoltage();
+
+    Bytes buffer;
+    ping.appendFrame(buffer);
+    voltage.appendFrame(buffer);
+    XCTAssertEqual(buffer, ping.frame() + voltage.frame());
+    auto expected = Bytes { 0x1F, 0x10, 0x00, 0x02, 0x01, 0x02, 0x1F, 0x12, 0x00, 0x00 };
+    XCTAssertEqual(buffer, expected);
+}
+
+@end